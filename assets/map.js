@@ -0,0 +1,138 @@
+/* Client-side callbacks of the map (src/components/visualization/map.py). */
+(function() {
+    let lastFigure = null;
+    let lastWindow = null;
+    let lastTraces = null;
+    let revision = 0;
+
+    /**
+     * Fill the point, density and trajectory layers of the figure, sent empty
+     * by the server, with fixes in the compact form of encode_map_data: the
+     * fixes of each season go to the point trace named after it, with their
+     * timestamps as hover labels, and the tracks of all individuals to the
+     * trajectory trace, separated by gaps.
+     */
+    function fillLayers(figure, points) {
+        const seasonByMonth = figure.layout.meta.season_by_month;
+        const count = points.seconds.length;
+        const seasons = new Array(count);
+        const hovertext = new Array(count);
+        for (let i = 0; i < count; i++) {
+            const date = new Date((points.time_base + points.seconds[i]) * 1000);
+            seasons[i] = seasonByMonth[date.getUTCMonth()];
+            hovertext[i] = date.toISOString().slice(0, 19).replace('T', ' ');
+        }
+
+        const ids = points.individual_id;
+        const order = Array.from({length: count}, function(_, i) { return i; }).sort(function(a, b) {
+            if (ids[a] !== ids[b]) {
+                return ids[a] < ids[b] ? -1 : 1;
+            }
+            return points.seconds[a] - points.seconds[b];
+        });
+        const trackLat = [];
+        const trackLon = [];
+        order.forEach(function(i, position) {
+            if (position > 0 && ids[i] !== ids[order[position - 1]]) {
+                trackLat.push(null);
+                trackLon.push(null);
+            }
+            trackLat.push(points.location_lat[i]);
+            trackLon.push(points.location_long[i]);
+        });
+
+        return figure.data.map(function(trace) {
+            if (trace.meta === 'scatter') {
+                const rows = [];
+                for (let i = 0; i < count; i++) {
+                    if (seasons[i] === trace.name) {
+                        rows.push(i);
+                    }
+                }
+                return Object.assign({}, trace, {
+                    lat: rows.map(function(i) { return points.location_lat[i]; }),
+                    lon: rows.map(function(i) { return points.location_long[i]; }),
+                    hovertext: rows.map(function(i) { return hovertext[i]; })
+                });
+            }
+            if (trace.meta === 'density') {
+                return Object.assign({}, trace, {lat: points.location_lat, lon: points.location_long});
+            }
+            if (trace.meta === 'trajectory') {
+                return Object.assign({}, trace, {lat: trackLat, lon: trackLon});
+            }
+            return trace;
+        });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        map: {
+            /** Store the clicked mode and highlight its button. */
+            selectMode: function(modeClicks, modeIds) {
+                const triggered = window.dash_clientside.callback_context.triggered_id;
+                if (!triggered) {
+                    return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+                }
+                const colors = modeIds.map(function(modeId) {
+                    return modeId.mode === triggered.mode ? 'primary' : 'secondary';
+                });
+                return [{view_mode: triggered.mode}, colors];
+            },
+
+            /** Show the next frame of the playback, and stop after the last one. */
+            nextFrame: function(nIntervals, frames) {
+                const noUpdate = window.dash_clientside.no_update;
+                if (!frames || nIntervals === 0) {
+                    return [noUpdate, noUpdate, noUpdate];
+                }
+                if (nIntervals > frames.length) {
+                    return [noUpdate, true, 'Lecture'];
+                }
+                return [frames[nIntervals - 1], noUpdate, noUpdate];
+            },
+
+            /**
+             * Draw the figure sent by the server with only the layer of the
+             * selected mode visible (the tiles being a layer of the map
+             * background), its point, density and trajectory layers filled
+             * with the data of the species or of the time window if any. A
+             * mode or window change keeps the current view and the patches
+             * applied to the displayed figure (selected point, map center);
+             * new data from the server resets them.
+             */
+            renderFigure: function(figure, appState, timeWindow, currentData, currentFigure) {
+                if (!figure || !currentData || figure.layout.meta.species !== currentData.species) {
+                    return window.dash_clientside.no_update;
+                }
+                const newData = figure !== lastFigure;
+                if (newData || timeWindow !== lastWindow) {
+                    lastFigure = figure;
+                    lastWindow = timeWindow;
+                    const inWindow = timeWindow && timeWindow.species === currentData.species;
+                    lastTraces = fillLayers(figure, inWindow ? timeWindow : currentData);
+                }
+                if (newData) {
+                    revision += 1;
+                }
+                const mode = (appState || {}).view_mode || 'scatter';
+                const data = lastTraces.map(function(trace, index) {
+                    if (trace.meta === 'highlight') {
+                        return newData || !currentFigure ? trace : currentFigure.data[index];
+                    }
+                    return Object.assign({}, trace, {visible: trace.meta === mode});
+                });
+                const layout = Object.assign({}, figure.layout, {
+                    uirevision: revision,
+                    coloraxis: Object.assign({}, figure.layout.coloraxis, {showscale: mode === 'density'})
+                });
+                const mapbox = !newData && currentFigure ? currentFigure.layout.mapbox : figure.layout.mapbox;
+                layout.mapbox = Object.assign({}, mapbox, {
+                    layers: (figure.layout.mapbox.layers || []).map(function(layer) {
+                        return Object.assign({}, layer, {visible: layer.name === 'tiles' && mode === 'tiles'});
+                    })
+                });
+                return {data: data, layout: layout};
+            }
+        }
+    });
+})();
@@ -1,14 +1,24 @@
 """Configuration File
 
 - Server configuration (HOST, PORT, DEBUG)
-- Data directory paths (DATA_RAW_DIR, DATA_CLEANED_DIR)
+- Startup (DATA_PIPELINE_ON_STARTUP, STARTUP_BUDGET_SECONDS)
+- Data directory paths (DATA_RAW_DIR, DATA_CLEANED_DIR, DATA_TILES_DIR, SPECIES_STATISTICS_FILE)
+- Data file compression (DATA_COMPRESSION, DATA_COMPRESSION_LEVEL)
 - Movebank API credentials (MOVEBANK_USERNAME, MOVEBANK_PASSWORD, MOVEBANK_BASE_URL)
+- Download settings (DOWNLOAD_CHUNK_SIZE, DOWNLOAD_MAX_RETRIES, DOWNLOAD_TIMEOUT)
+- Computation backends (KERNEL_BACKEND, STATS_BACKEND)
+- Cache warm-up (WARMUP_ENABLED, WARMUP_DELAY, WARMUP_POLL_INTERVAL, WARMUP_ACCESS_FILE, WARMUP_SAVE_INTERVAL)
+- HTTP compression (HTTP_COMPRESSION_ENABLED, HTTP_COMPRESSION_MIN_SIZE, HTTP_COMPRESSION_LEVEL)
+- Temporal levels of detail (LOD_TIERS)
+- Migration flows (FLOW_CELL_DEGREES)
+- Map payloads, tiles and playback (MAP_COORDINATE_DECIMALS, MAP_MAX_POINTS, TILE_MAX_ZOOM, PLAYBACK_FRAMES, PLAYBACK_INTERVAL_MS)
 """
 
 import os
 from dotenv import load_dotenv
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Final
+from typing import Dict, Optional, Final
 
 load_dotenv()
 
@@ -24,17 +34,42 @@ PORT: Final[int] = 8050
 DEBUG: Final[bool] = False
 """Enable debug mode (True) or not (False)."""
 
+# ----------------------------
+# Startup Configuration
+# ----------------------------
+DATA_PIPELINE_ON_STARTUP: Final[bool] = os.getenv("DATA_PIPELINE_ON_STARTUP", "true").lower() == "true"
+"""Download and clean the data when the application starts; disable it when the data is prepared beforehand."""
+
+STARTUP_BUDGET_SECONDS: Final[float] = float(os.getenv("STARTUP_BUDGET_SECONDS", "2.5"))
+"""Maximum time to import the application without the data pipeline, checked by `python -m src.utils.startup`."""
+
 # ----------------------------
 # Data Directory Configuration
 # ----------------------------
 DATA_RAW_DIR: Final[Path] = Path("data", "raw")
-DATA_RAW_DIR.mkdir(parents=True, exist_ok=True)
 """Directory for raw data."""
 
 DATA_CLEANED_DIR: Final[Path] = Path("data", "cleaned")
-DATA_CLEANED_DIR.mkdir(parents=True, exist_ok=True)
 """Directory for cleaned data."""
 
+DATA_TILES_DIR: Final[Path] = Path("data", "tiles")
+"""Directory for the pre-rendered map tiles, one z/x/y pyramid per species."""
+
+def ensure_data_directories() -> None:
+    """Create the data directories, by the steps that write to them rather than on import."""
+    for directory in (DATA_RAW_DIR, DATA_CLEANED_DIR, DATA_TILES_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+
+SPECIES_STATISTICS_FILE: Final[Path] = DATA_CLEANED_DIR / "species_statistics.csv"
+"""Comparison table of the statistics of every species."""
+
+DATA_COMPRESSION: Final[str] = os.getenv("DATA_COMPRESSION", "zstd" if find_spec("zstandard") else "gzip")
+"""Codec of the raw and cleaned data files: 'none', 'gzip', 'zstd' (needs zstandard), 'bz2' or 'xz'.
+Defaults to 'zstd' when zstandard is installed, else 'gzip'."""
+
+DATA_COMPRESSION_LEVEL: Final[int] = int(os.getenv("DATA_COMPRESSION_LEVEL", "3"))
+"""Compression level of the data files, low values favour speed over size."""
+
 # ----------------------------
 # Movebank API Access Configuration
 # ----------------------------
@@ -46,3 +81,81 @@ MOVEBANK_PASSWORD: Optional[str] = os.getenv("MOVEBANK_PASSWORD")
 
 MOVEBANK_BASE_URL: Final[str] = "https://www.movebank.org/movebank/service/direct-read"
 """Base URL for Movebank API requests."""
+
+DOWNLOAD_CHUNK_SIZE: Final[int] = 1024 * 1024
+"""Size in bytes of the chunks written to disk while downloading."""
+
+DOWNLOAD_MAX_RETRIES: Final[int] = 3
+"""Attempts to resume an interrupted download before giving up until the next run."""
+
+DOWNLOAD_TIMEOUT: Final[float] = 60
+"""Seconds without data from the server before a download attempt fails."""
+
+# ----------------------------
+# Computation Configuration
+# ----------------------------
+KERNEL_BACKEND: Final[str] = os.getenv("KERNEL_BACKEND", "auto")
+"""Backend for per-track kernels: 'auto' (Numba if installed), 'numpy' or 'jit'."""
+
+STATS_BACKEND: Final[str] = os.getenv("STATS_BACKEND", "pandas")
+"""Backend for species statistics: 'pandas' (in memory) or 'polars' (streamed from a Parquet copy, if installed)."""
+
+# ----------------------------
+# Cache Warm-up Configuration
+# ----------------------------
+WARMUP_ENABLED: Final[bool] = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+"""Preload species data and statistics in the background after startup."""
+
+WARMUP_DELAY: Final[float] = 2.0
+"""Seconds to wait after startup before warming the caches."""
+
+WARMUP_POLL_INTERVAL: Final[float] = 0.05
+"""Seconds between checks for live requests while the warm-up is paused."""
+
+WARMUP_ACCESS_FILE: Final[Path] = Path("data", "species_access.json")
+"""Request count per species, used to rank the warm-up."""
+
+WARMUP_SAVE_INTERVAL: Final[float] = 60.0
+"""Seconds between saves of the request counts by the warm-up thread; they are also saved at exit."""
+
+# ----------------------------
+# HTTP Compression Configuration
+# ----------------------------
+HTTP_COMPRESSION_ENABLED: Final[bool] = os.getenv("HTTP_COMPRESSION_ENABLED", "true").lower() == "true"
+"""Compress responses with gzip when the browser accepts it."""
+
+HTTP_COMPRESSION_MIN_SIZE: Final[int] = 1024
+"""Responses smaller than this many bytes are sent uncompressed."""
+
+HTTP_COMPRESSION_LEVEL: Final[int] = int(os.getenv("HTTP_COMPRESSION_LEVEL", "5"))
+"""gzip level of the responses (1 = fastest, 9 = smallest)."""
+
+# ----------------------------
+# Level-of-Detail Configuration
+# ----------------------------
+LOD_TIERS: Final[Dict[str, int]] = {"hour": 3600, "day": 86400, "week": 604800}
+"""Resampled tiers of the tracks written by the cleaning step, with their interval in seconds."""
+
+# ----------------------------
+# Flow Configuration
+# ----------------------------
+FLOW_CELL_DEGREES: Final[float] = 2.0
+"""Size (degrees) of the grid cells that seasonal positions are snapped to for the flow map."""
+
+# ----------------------------
+# Map Configuration
+# ----------------------------
+MAP_COORDINATE_DECIMALS: Final[int] = 4
+"""Decimals kept in the coordinates sent to the map (4 decimals is about 10 m)."""
+
+MAP_MAX_POINTS: Final[int] = int(os.getenv("MAP_MAX_POINTS", "50000"))
+"""Fixes drawn by the map at most: the finest tier of `LOD_TIERS` within this budget is drawn."""
+
+TILE_MAX_ZOOM: Final[int] = 8
+"""Deepest zoom level of the pre-rendered tiles, deeper zooms enlarge its tiles."""
+
+PLAYBACK_FRAMES: Final[int] = 100
+"""Number of frames of a playback over the whole study."""
+
+PLAYBACK_INTERVAL_MS: Final[int] = 500
+"""Milliseconds between two playback frames."""